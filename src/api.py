@@ -1,27 +1,73 @@
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from src.models import ExplainRequest, Question, Option, ExplanationResponse
+from src.utils.checkpoint import open_checkpointer
+from src.utils.question_cache import create_question_cache
 
 from .workflow import Workflow
 
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with open_checkpointer() as checkpointer:
+        app.state.checkpointer = checkpointer
+        app.state.question_cache = create_question_cache()
+        yield
+
+
 app = FastAPI(
     title="PDF Question Extractor API",
     description="Extract multiple choice questions from PDF exam files",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 
 @app.post("/explain", response_model=ExplanationResponse)
 async def explain(request: ExplainRequest):
-    workflow = Workflow()
+    question_cache = app.state.question_cache
+    embedding = None
+    cached = None
+    if question_cache:
+        # The cache is only an optimisation: on embedding failure fall through to the workflow
+        try:
+            embedding = await question_cache.embed(request.question)
+            cached = question_cache.lookup(request.question, request.filter, embedding)
+        except Exception:
+            logger.exception("Question cache lookup failed")
+
+        if cached:
+            return ExplanationResponse(
+                question=request.question,
+                option_explanations=question_cache.explanations_for(request.question, cached),
+                is_complete=True,
+                training_references=cached.training_references
+            )
+
+    workflow = Workflow(checkpointer=app.state.checkpointer)
     state = await workflow.run(
         request.question,
         certification_id=request.filter.certification_id,
         tech=request.filter.tech,
         tech_id=request.filter.tech_id,
-        training_slug=request.filter.training_slug
+        training_slug=request.filter.training_slug,
+        thread_id=request.request_id
     )
 
+    if question_cache and embedding is not None and state.is_complete:
+        question_cache.add(
+            request.question,
+            request.filter,
+            embedding,
+            state.option_explanations,
+            state.training_references
+        )
+
     return ExplanationResponse(
         question=request.question,
         option_explanations=state.option_explanations,
@@ -56,6 +102,14 @@ async def test():
     )
 
 
+@app.get("/cache/stats")
+async def cache_stats():
+    """Semantic question cache statistics"""
+    if not app.state.question_cache:
+        return {"enabled": False}
+    return {"enabled": True, **app.state.question_cache.stats()}
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
@@ -71,6 +125,7 @@ async def root():
         "endpoints": {
             "POST /explain": "Generate explanations for MCQ options",
             "GET /test": "Test endpoint with sample question",
+            "GET /cache/stats": "Question cache hit rate, embed/search latency and memory",
             "GET /health": "Health check",
             "GET /docs": "API documentation"
         }
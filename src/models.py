@@ -22,6 +22,7 @@ class Filter(BaseModel):
 class ExplainRequest(BaseModel):
   question: Question
   filter: Filter = Field(default_factory=Filter)
+  request_id: Optional[str] = Field(default=None, description="Retrying with the same ID resumes a failed run from its last checkpoint")
 
 class OptionExplanation(BaseModel):
   option: str
@@ -0,0 +1,156 @@
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager, suppress
+from typing import AsyncIterator, Optional
+
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_TTL_SECONDS = 24 * 60 * 60
+MAX_PURGE_INTERVAL_SECONDS = 60 * 60
+
+
+class CheckpointManager:
+    """
+    Wraps a SQLite LangGraph checkpointer and tracks, per thread, which input it was
+    started with and when it was last used, so checkpoints are only resumed for the
+    same input and those left behind by failed runs can be expired.
+    """
+
+    def __init__(self, saver: AsyncSqliteSaver, ttl_seconds: int = DEFAULT_CHECKPOINT_TTL_SECONDS):
+        self.saver = saver
+        self.ttl_seconds = ttl_seconds
+        self._thread_locks: dict[str, asyncio.Lock] = {}
+        self._thread_users: dict[str, int] = {}
+
+    async def setup(self) -> None:
+        await self.saver.setup()
+        async with self.saver.lock:
+            await self.saver.conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS checkpoint_threads (
+                    thread_id TEXT PRIMARY KEY,
+                    input_hash TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            await self.saver.conn.commit()
+
+    @asynccontextmanager
+    async def claim(self, thread_id: str, input_hash: str) -> AsyncIterator[bool]:
+        """
+        Hold a thread for the duration of a run, serializing concurrent runs of the same thread.
+
+        Yields True when the thread's checkpoints were written for the same input and may be
+        resumed. Checkpoints left by a different input are deleted before yielding False.
+        """
+        lock = self._thread_locks.setdefault(thread_id, asyncio.Lock())
+        self._thread_users[thread_id] = self._thread_users.get(thread_id, 0) + 1
+        try:
+            async with lock:
+                async with self.saver.lock:
+                    async with self.saver.conn.execute(
+                        "SELECT input_hash FROM checkpoint_threads WHERE thread_id = ?",
+                        (thread_id,)
+                    ) as cursor:
+                        row = await cursor.fetchone()
+
+                matches = row is not None and row[0] == input_hash
+                if not matches:
+                    await self.clear(thread_id)
+
+                async with self.saver.lock:
+                    await self.saver.conn.execute(
+                        "INSERT OR REPLACE INTO checkpoint_threads (thread_id, input_hash, updated_at) VALUES (?, ?, ?)",
+                        (thread_id, input_hash, time.time())
+                    )
+                    await self.saver.conn.commit()
+
+                yield matches
+        finally:
+            self._thread_users[thread_id] -= 1
+            if not self._thread_users[thread_id]:
+                del self._thread_users[thread_id]
+                del self._thread_locks[thread_id]
+
+    async def clear(self, thread_id: str) -> None:
+        """Drop every checkpoint stored for a thread, keeping its tracking row."""
+        await self.saver.adelete_thread(thread_id)
+
+    async def delete(self, thread_id: str) -> None:
+        """Drop every checkpoint stored for a thread along with its tracking row."""
+        await self.clear(thread_id)
+        async with self.saver.lock:
+            await self.saver.conn.execute(
+                "DELETE FROM checkpoint_threads WHERE thread_id = ?",
+                (thread_id,)
+            )
+            await self.saver.conn.commit()
+
+    async def purge_expired(self) -> int:
+        """
+        Delete checkpoints for threads that have not been run within the TTL.
+
+        Returns:
+            int: Number of threads removed
+        """
+        cutoff = time.time() - self.ttl_seconds
+        async with self.saver.lock:
+            async with self.saver.conn.execute(
+                "SELECT thread_id FROM checkpoint_threads WHERE updated_at < ?",
+                (cutoff,)
+            ) as cursor:
+                expired = [row[0] for row in await cursor.fetchall()]
+
+        purged = 0
+        for thread_id in expired:
+            # Each delete yields to the event loop, so a run may claim a thread mid-purge
+            if thread_id in self._thread_locks:
+                continue
+            await self.delete(thread_id)
+            purged += 1
+
+        return purged
+
+    async def purge_periodically(self) -> None:
+        interval = min(self.ttl_seconds, MAX_PURGE_INTERVAL_SECONDS)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.purge_expired()
+            except Exception:
+                logger.exception("Failed to purge expired checkpoints")
+
+
+@asynccontextmanager
+async def open_checkpointer(db_path: Optional[str] = None) -> AsyncIterator[Optional[CheckpointManager]]:
+    """
+    Open the SQLite checkpoint store configured by CHECKPOINT_DB_PATH.
+
+    Expired checkpoints are purged on open and then periodically in the background.
+    Yields None when checkpointing is not configured, so callers can pass the
+    result straight to Workflow.
+    """
+    db_path = db_path or os.getenv("CHECKPOINT_DB_PATH")
+    if not db_path:
+        yield None
+        return
+
+    ttl_seconds = int(os.getenv("CHECKPOINT_TTL_SECONDS", DEFAULT_CHECKPOINT_TTL_SECONDS))
+
+    async with AsyncSqliteSaver.from_conn_string(db_path) as saver:
+        manager = CheckpointManager(saver, ttl_seconds=ttl_seconds)
+        await manager.setup()
+        await manager.purge_expired()
+        purge_task = asyncio.create_task(manager.purge_periodically())
+        try:
+            yield manager
+        finally:
+            purge_task.cancel()
+            with suppress(asyncio.CancelledError):
+                await purge_task
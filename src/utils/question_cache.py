@@ -0,0 +1,158 @@
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import numpy as np
+from langchain_openai import OpenAIEmbeddings
+
+from src.models import Filter, OptionExplanation, Question, TrainingReference
+
+
+DEFAULT_SIMILARITY_THRESHOLD = 0.92
+DEFAULT_MAX_ENTRIES = 10000
+
+
+def normalize_option(text: str) -> str:
+    text = re.sub(r'\s+', ' ', text.lower()).strip()
+    return text.rstrip('.;,')
+
+
+def question_text(question: Question) -> str:
+    return f"{question.title}\n{question.description}"
+
+
+@dataclass
+class CachedExplanation:
+    options: Tuple[Tuple[str, bool], ...]
+    filter: Filter
+    option_explanations: List[OptionExplanation]
+    training_references: List[TrainingReference]
+
+
+class QuestionCache:
+    """
+    In-process semantic cache of explained questions.
+
+    Question embeddings are kept L2-normalized in a NumPy ring buffer of max_entries
+    rows, allocated on the first add, so a lookup is one matrix-vector product over the
+    filled rows (exact cosine search) and the oldest entry is overwritten once full.
+    A hit requires the similarity to reach the threshold and the options and filter to
+    match after normalization.
+    """
+
+    def __init__(self, embedding_model: OpenAIEmbeddings,
+                 similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.embedding_model = embedding_model
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+
+        self.embeddings: Optional[np.ndarray] = None
+        self.entries: List[Optional[CachedExplanation]] = []
+        self.size = 0
+        self.next_slot = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.embeds = 0
+        self.total_embed_seconds = 0.0
+        self.total_search_seconds = 0.0
+
+    @staticmethod
+    def _option_key(question: Question) -> Tuple[Tuple[str, bool], ...]:
+        # Sorted rather than a set so repeated options still count towards a match
+        return tuple(sorted((normalize_option(o.option), o.is_correct) for o in question.options))
+
+    async def embed(self, question: Question) -> np.ndarray:
+        started = time.perf_counter()
+        vector = np.asarray(await self.embedding_model.aembed_query(question_text(question)), dtype=np.float32)
+        self.total_embed_seconds += time.perf_counter() - started
+        self.embeds += 1
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, question: Question, filter: Filter, embedding: np.ndarray) -> Optional[CachedExplanation]:
+        started = time.perf_counter()
+        match = None
+
+        if self.size:
+            scores = self.embeddings[:self.size] @ embedding
+            candidates = np.flatnonzero(scores >= self.similarity_threshold)
+            option_key = self._option_key(question)
+            for i in candidates[np.argsort(-scores[candidates])]:
+                entry = self.entries[i]
+                if entry.options == option_key and entry.filter == filter:
+                    match = entry
+                    break
+
+        self.total_search_seconds += time.perf_counter() - started
+        if match:
+            self.hits += 1
+        else:
+            self.misses += 1
+        return match
+
+    def add(self, question: Question, filter: Filter, embedding: np.ndarray,
+            option_explanations: List[OptionExplanation],
+            training_references: List[TrainingReference]) -> None:
+        entry = CachedExplanation(
+            options=self._option_key(question),
+            filter=filter,
+            option_explanations=option_explanations,
+            training_references=training_references
+        )
+
+        if self.embeddings is None:
+            self.embeddings = np.zeros((self.max_entries, embedding.shape[0]), dtype=np.float32)
+            self.entries = [None] * self.max_entries
+
+        self.embeddings[self.next_slot] = embedding
+        self.entries[self.next_slot] = entry
+        self.next_slot = (self.next_slot + 1) % self.max_entries
+        self.size = min(self.size + 1, self.max_entries)
+
+    def explanations_for(self, question: Question, entry: CachedExplanation) -> List[OptionExplanation]:
+        """Map cached explanations onto the option order and wording of a new question."""
+        by_option = {
+            (normalize_option(e.option), e.is_correct): e.explanation
+            for e in entry.option_explanations
+        }
+        return [
+            OptionExplanation(
+                option=option.option,
+                is_correct=option.is_correct,
+                explanation=by_option[(normalize_option(option.option), option.is_correct)]
+            )
+            for option in question.options
+        ]
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        index_bytes = self.embeddings.nbytes if self.embeddings is not None else 0
+        return {
+            "entries": self.size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "avg_embed_latency_ms": (self.total_embed_seconds / self.embeds) * 1000 if self.embeds else 0.0,
+            "avg_search_latency_ms": (self.total_search_seconds / lookups) * 1000 if lookups else 0.0,
+            "index_memory_bytes": index_bytes
+        }
+
+
+def create_question_cache() -> Optional[QuestionCache]:
+    """
+    Build the question cache from environment settings.
+
+    Returns None unless QUESTION_CACHE_ENABLED is set to true.
+    """
+    if os.getenv("QUESTION_CACHE_ENABLED", "false").lower() != "true":
+        return None
+
+    return QuestionCache(
+        OpenAIEmbeddings(model="text-embedding-3-small"),
+        similarity_threshold=float(os.getenv("QUESTION_CACHE_THRESHOLD", DEFAULT_SIMILARITY_THRESHOLD)),
+        max_entries=int(os.getenv("QUESTION_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES))
+    )
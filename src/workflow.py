@@ -1,5 +1,7 @@
 import os
 import json
+import hashlib
+import logging
 from typing import Optional
 from langgraph.graph import StateGraph, END
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
@@ -9,13 +11,17 @@ from langchain_core.messages import HumanMessage
 from dotenv import load_dotenv
 
 from src.utils.agent import render_template
+from src.utils.checkpoint import CheckpointManager
 from .models import AnswerQuestionResponse, ExplanationState, Question, OptionExplanation, ReviewAnswerResponse, ReformulateContextResponse, TrainingReference, to_kebab_case, ClassifyReferencesResponse
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 
 class Workflow:
-    def __init__(self):
+    def __init__(self, checkpointer: Optional[CheckpointManager] = None):
+        self.checkpointer = checkpointer
 
         anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
         openai_api_key = os.getenv("OPENAI_API_KEY")
@@ -93,7 +99,9 @@ class Workflow:
         graph.add_edge("advance_option", "answer_option")
         graph.add_edge("finalize", END)
 
-        compiled_graph = graph.compile()
+        compiled_graph = graph.compile(
+            checkpointer=self.checkpointer.saver if self.checkpointer else None
+        )
 
         try:
           compiled_graph.get_graph().draw_mermaid_png(output_file_path="workflow.png")
@@ -413,15 +421,48 @@ class Workflow:
 
     async def run(self, question: Question, certification_id: Optional[str] = None, 
                   tech: Optional[str] = None, tech_id: Optional[str] = None, 
-                  training_slug: Optional[str] = None) -> ExplanationState:
-        initial_state = ExplanationState(
+                  training_slug: Optional[str] = None,
+                  thread_id: Optional[str] = None) -> ExplanationState:
+        graph_input = ExplanationState(
             question=question,
             certification_id=certification_id,
             tech=tech,
             tech_id=tech_id,
             training_slug=training_slug
         )
-        final_state = await self.workflow.ainvoke(initial_state, {
-            "recursion_limit": 120
-        })
+        config = {"recursion_limit": 120}
+
+        if self.checkpointer is None or thread_id is None:
+            final_state = await self.workflow.ainvoke(graph_input, config)
+            return ExplanationState(**final_state)
+
+        config["configurable"] = {"thread_id": thread_id}
+        input_hash = hashlib.sha256(
+            graph_input.model_dump_json(
+                include={"question", "certification_id", "tech", "tech_id", "training_slug"}
+            ).encode()
+        ).hexdigest()
+
+        final_state = None
+        async with self.checkpointer.claim(thread_id, input_hash) as matches:
+            snapshot = await self.workflow.aget_state(config)
+            # A pending next node means a previous run of this thread with the same input
+            # failed midway: resume from its last completed node instead of starting over.
+            if matches and snapshot.next:
+                graph_input = None
+            elif matches and snapshot.values:
+                # A previous run with the same input completed but its checkpoints were not
+                # cleaned up: return its final state rather than repeating every LLM call.
+                final_state = snapshot.values
+            elif snapshot.values:
+                await self.checkpointer.clear(thread_id)
+
+            if final_state is None:
+                final_state = await self.workflow.ainvoke(graph_input, config)
+
+            try:
+                await self.checkpointer.delete(thread_id)
+            except Exception:
+                logger.exception(f"Failed to delete checkpoints for thread {thread_id}")
+
         return ExplanationState(**final_state)